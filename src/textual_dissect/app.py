@@ -1,24 +1,39 @@
 from __future__ import annotations
 
 import inspect
-from dataclasses import dataclass
+import json
+import os
+import sys
+import threading
+from contextlib import suppress
+from dataclasses import asdict, dataclass
 from enum import Enum
+from functools import lru_cache, partial
 from importlib import import_module
+from pathlib import Path
+from tempfile import NamedTemporaryFile
 from textwrap import dedent
+from types import ModuleType
+from typing import Any
 
 import tree_sitter_scss
-from textual import __version__, on
+from platformdirs import user_cache_dir
+from textual import __version__, on, work
 from textual.app import App, ComposeResult
 from textual.case import camel_to_snake
 from textual.containers import HorizontalGroup
 from textual.content import ContentType
 from textual.dom import DOMNode
 from textual.reactive import var
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import Link, OptionList, TabbedContent, TabPane, TextArea, Tree
 from textual.widgets.option_list import Option
+from textual.worker import get_current_worker
 from tree_sitter import Language
 
+from textual_dissect import __version__ as textual_dissect_version
+
 
 class WidgetType(Enum):
     CORE_WIDGET = 1
@@ -86,6 +101,12 @@ WIDGET_CLASSES = {
     ],
 }
 
+_WIDGET_SNAKE_CASE_NAMES = {
+    widget_class: camel_to_snake(widget_class)
+    for widget_classes in WIDGET_CLASSES.values()
+    for widget_class in widget_classes
+}
+
 DOCS_BASE_URL = "https://textual.textualize.io/"
 DOCS_WIDGETS_URL = DOCS_BASE_URL + "widgets/"
 DOCS_CONTAINERS_URL = DOCS_BASE_URL + "api/containers/#textual.containers"
@@ -105,95 +126,210 @@ class WidgetDetails:
     default_css: str
 
 
-_WIDGET_DETAILS_CACHE: dict[str, WidgetDetails] = {}
+def _import_module(name: str) -> ModuleType:
+    # Most widget modules will already have been imported by Textual, so check
+    # `sys.modules` first to skip the import machinery. Modules are also
+    # imported from the prewarm worker thread, so a module which is still
+    # being initialised must go through the import lock instead.
+    module = sys.modules.get(name)
+    if (
+        module is None
+        or getattr(getattr(module, "__spec__", None), "_initializing", False)
+        is not False
+    ):
+        module = import_module(name)
+    return module
 
 
-def get_widget_details(
+@lru_cache(maxsize=None)
+def _format_default_css(raw_default_css: str) -> str:
+    # Some widgets inherit their `DEFAULT_CSS` unchanged from a base class
+    # (e.g. `Checkbox` and `RadioButton`), so only dedent each string once.
+    return dedent(raw_default_css).strip()
+
+
+def _load_widget_details(
     widget_class: str,
     widget_type: WidgetType,
 ) -> WidgetDetails:
-    if widget_class not in _WIDGET_DETAILS_CACHE:
-        widget_snake_case = camel_to_snake(widget_class)
-        if widget_type == WidgetType.CORE_WIDGET:
-            docs_url = DOCS_WIDGETS_URL + widget_snake_case
-
-            if widget_class == "MarkdownViewer":
-                # The `MarkdownViewer` is a special case as the module only
-                # exports the class defined in `_markdown.py`, for some reason?
-                module_path = f"._markdown"
-                source_url = SRC_WIDGETS_URL + "_markdown.py"
-            else:
-                module_path = f"._{widget_snake_case}"
-                source_url = SRC_WIDGETS_URL + f"_{widget_snake_case}.py"
+    widget_snake_case = _WIDGET_SNAKE_CASE_NAMES[widget_class]
+    if widget_type == WidgetType.CORE_WIDGET:
+        docs_url = DOCS_WIDGETS_URL + widget_snake_case
 
-            module = import_module(module_path, package="textual.widgets")
+        if widget_class == "MarkdownViewer":
+            # The `MarkdownViewer` is a special case as the module only
+            # exports the class defined in `_markdown.py`, for some reason?
+            module_name = "textual.widgets._markdown"
+            source_url = SRC_WIDGETS_URL + "_markdown.py"
+        else:
+            module_name = f"textual.widgets._{widget_snake_case}"
+            source_url = SRC_WIDGETS_URL + f"_{widget_snake_case}.py"
 
-        elif widget_type == WidgetType.CONTAINER:
-            module = import_module(".containers", package="textual")
+        module = _import_module(module_name)
 
-            docs_url = DOCS_CONTAINERS_URL + f".{widget_class}"
-            source_url = SRC_CONTAINERS_URL
+    elif widget_type == WidgetType.CONTAINER:
+        module = _import_module("textual.containers")
 
-        elif widget_type == WidgetType.BASE_CLASS:
-            module = import_module(f".{widget_snake_case}", package="textual")
+        docs_url = DOCS_CONTAINERS_URL + f".{widget_class}"
+        source_url = SRC_CONTAINERS_URL
 
-            docs_url = DOCS_BASE_URL + f"api/{widget_snake_case}"
-            source_url = (
-                SRC_BASE_URL + SRC_VERSION_PATH + f"src/textual/{widget_snake_case}.py"
-            )
+    elif widget_type == WidgetType.BASE_CLASS:
+        module = _import_module(f"textual.{widget_snake_case}")
 
-        class_ = getattr(module, widget_class)
+        docs_url = DOCS_BASE_URL + f"api/{widget_snake_case}"
+        source_url = (
+            SRC_BASE_URL + SRC_VERSION_PATH + f"src/textual/{widget_snake_case}.py"
+        )
 
-        raw_default_css = class_.DEFAULT_CSS
-        default_css = dedent(raw_default_css).strip()
+    class_ = getattr(module, widget_class)
 
-        base_classes: list[str] = []
-        current_class = class_
-        while True:
-            base_classes.append(current_class.__name__)
-            for base in current_class.__bases__:
-                if issubclass(base, DOMNode):
-                    current_class = base
-                    break
-            else:
+    raw_default_css = class_.DEFAULT_CSS
+    default_css = _format_default_css(raw_default_css)
+
+    base_classes: list[str] = []
+    current_class = class_
+    while True:
+        base_classes.append(current_class.__name__)
+        for base in current_class.__bases__:
+            if issubclass(base, DOMNode):
+                current_class = base
                 break
-        base_classes.reverse()
-
-        child_widgets: list[str] = []
-        if widget_type != WidgetType.CONTAINER:
-            for name, obj in inspect.getmembers(module, inspect.isclass):
-                if (
-                    issubclass(obj, Widget)
-                    and obj.__module__ == module.__name__
-                    and obj != class_
+        else:
+            break
+    base_classes.reverse()
+
+    child_widgets: list[str] = []
+    if widget_type != WidgetType.CONTAINER:
+        for name, obj in inspect.getmembers(module, inspect.isclass):
+            if (
+                issubclass(obj, Widget)
+                and obj.__module__ == module.__name__
+                and obj != class_
+            ):
+                if widget_class == "Markdown" and name in (
+                    "MarkdownViewer",
+                    "MarkdownTableOfContents",
                 ):
-                    if widget_class == "Markdown" and name in (
-                        "MarkdownViewer",
-                        "MarkdownTableOfContents",
-                    ):
-                        continue
-                    else:
-                        child_widgets.append(name)
-            # Currently this list is missing the child widgets imported from
-            # other modules. There might be a smarter way of adding these, but
-            # for now just hard code the missing widgets.
-            if widget_class == "ListView":
-                child_widgets.append("ListItem")
-            elif widget_class == "RadioSet":
-                child_widgets.append("RadioButton")
-            elif widget_class == "TabbedContent":
-                child_widgets.append("ContentSwitcher")
-            child_widgets.sort()
-
-        _WIDGET_DETAILS_CACHE[widget_class] = WidgetDetails(
-            docs_url=docs_url,
-            source_url=source_url,
-            base_classes=base_classes,
-            child_widgets=child_widgets,
-            default_css=default_css,
-        )
+                    continue
+                else:
+                    child_widgets.append(name)
+        # Currently this list is missing the child widgets imported from
+        # other modules. There might be a smarter way of adding these, but
+        # for now just hard code the missing widgets.
+        if widget_class == "ListView":
+            child_widgets.append("ListItem")
+        elif widget_class == "RadioSet":
+            child_widgets.append("RadioButton")
+        elif widget_class == "TabbedContent":
+            child_widgets.append("ContentSwitcher")
+        child_widgets.sort()
+
+    return WidgetDetails(
+        docs_url=docs_url,
+        source_url=source_url,
+        base_classes=base_classes,
+        child_widgets=child_widgets,
+        default_css=default_css,
+    )
+
+
+_WIDGET_DETAILS_CACHE: dict[str, WidgetDetails] = {}
+_WIDGET_DETAILS_CACHE_LOCK = threading.Lock()
 
-    return _WIDGET_DETAILS_CACHE[widget_class]
+
+def get_widget_details(
+    widget_class: str,
+    widget_type: WidgetType,
+) -> WidgetDetails:
+    if (widget_details := _WIDGET_DETAILS_CACHE.get(widget_class)) is not None:
+        return widget_details
+
+    # The details may also be loaded by the app's prewarm worker thread, so
+    # only load them while holding the lock, checking the cache again in case
+    # the worker loaded them in the meantime.
+    with _WIDGET_DETAILS_CACHE_LOCK:
+        widget_details = _WIDGET_DETAILS_CACHE.get(widget_class)
+        if widget_details is None:
+            widget_details = _load_widget_details(widget_class, widget_type)
+            _WIDGET_DETAILS_CACHE[widget_class] = widget_details
+
+        return widget_details
+
+
+_WIDGET_DETAILS_CACHE_PATH = (
+    Path(user_cache_dir("textual-dissect")) / "widget_details.json"
+)
+# The saved details are only valid for the versions they were loaded with.
+_WIDGET_DETAILS_CACHE_VERSION = (
+    f"textual-dissect=={textual_dissect_version},textual=={__version__}"
+)
+
+
+def _widget_details_from_json(details: dict[str, Any]) -> WidgetDetails:
+    widget_details = WidgetDetails(**details)
+    if not (
+        isinstance(widget_details.docs_url, str)
+        and isinstance(widget_details.source_url, str)
+        and isinstance(widget_details.default_css, str)
+        and isinstance(widget_details.base_classes, list)
+        and all(isinstance(class_, str) for class_ in widget_details.base_classes)
+        and isinstance(widget_details.child_widgets, list)
+        and all(isinstance(child, str) for child in widget_details.child_widgets)
+    ):
+        raise ValueError(f"Invalid cached widget details: {details!r}")
+    return widget_details
+
+
+def read_widget_details_cache() -> None:
+    try:
+        with _WIDGET_DETAILS_CACHE_PATH.open(encoding="utf-8") as cache_file:
+            cache = json.load(cache_file)
+        if cache["version"] != _WIDGET_DETAILS_CACHE_VERSION:
+            return
+        saved_widget_details = {
+            widget_class: _widget_details_from_json(details)
+            for widget_class, details in cache["widget_details"].items()
+        }
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        # The cache file is untrusted input, so a missing, corrupt or
+        # malformed file is simply ignored and will be replaced.
+        return
+
+    with _WIDGET_DETAILS_CACHE_LOCK:
+        for widget_class, widget_details in saved_widget_details.items():
+            _WIDGET_DETAILS_CACHE.setdefault(widget_class, widget_details)
+
+
+def write_widget_details_cache() -> None:
+    with _WIDGET_DETAILS_CACHE_LOCK:
+        cache = {
+            "version": _WIDGET_DETAILS_CACHE_VERSION,
+            "widget_details": {
+                widget_class: asdict(widget_details)
+                for widget_class, widget_details in _WIDGET_DETAILS_CACHE.items()
+            },
+        }
+
+    temp_path: str | None = None
+    try:
+        _WIDGET_DETAILS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, so another instance of the app
+        # never reads a partially written cache.
+        with NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=_WIDGET_DETAILS_CACHE_PATH.parent,
+            delete=False,
+        ) as temp_file:
+            temp_path = temp_file.name
+            json.dump(cache, temp_file)
+        os.replace(temp_path, _WIDGET_DETAILS_CACHE_PATH)
+    except OSError:
+        # Saving the cache is only an optimization, so don't crash the app,
+        # but don't leave a stray temporary file behind either.
+        if temp_path is not None:
+            with suppress(OSError):
+                os.unlink(temp_path)
 
 
 class WidgetsList(OptionList):
@@ -286,18 +422,18 @@ class InheritanceTree(Tree[str]):
     def watch_base_classes(self) -> None:
         assert len(self.base_classes) > 1
 
-        self.clear()
-
-        widget = self.root.add(
-            label=self.base_classes[1],
-            data=self.base_classes[1],
-            expand=True,
-            allow_expand=False,
-        )
-        for class_ in self.base_classes[2:]:
-            widget = widget.add(
-                label=class_, data=class_, expand=True, allow_expand=False
-            )
+        # Widgets usually share their first few base classes, so reuse the
+        # nodes from the previous tree and only replace the rest of the chain.
+        node = self.root
+        for class_ in self.base_classes[1:]:
+            if node.children and node.children[0].data == class_:
+                node = node.children[0]
+            else:
+                node.remove_children()
+                node = node.add(
+                    label=class_, data=class_, expand=True, allow_expand=False
+                )
+        node.remove_children()
 
         self.cursor_line = self.last_line
 
@@ -337,7 +473,13 @@ class ChildWidgetsList(OptionList):
         )
 
 
-_TCSS_LANGUAGE = Language(tree_sitter_scss.language())
+@lru_cache(maxsize=1)
+def _get_tcss_language() -> Language:
+    # Defer loading the tree-sitter language until the first `DefaultCSSView`
+    # is created, then share it between all the views.
+    return Language(tree_sitter_scss.language())
+
+
 _TCSS_HIGHLIGHT_QUERY = """
 (comment) @comment @spell
 
@@ -393,7 +535,7 @@ class DefaultCSSView(TextArea):
     def __init__(self) -> None:
         super().__init__(read_only=True)
         self.border_title = "Default CSS"
-        self.register_language("tcss", _TCSS_LANGUAGE, _TCSS_HIGHLIGHT_QUERY)
+        self.register_language("tcss", _get_tcss_language(), _TCSS_HIGHLIGHT_QUERY)
         self.language = "tcss"
 
 
@@ -403,6 +545,7 @@ class WidgetDetailsPane(TabPane):
     def __init__(self, title: ContentType, widget_type: WidgetType, id: str):
         super().__init__(title, id=id)
         self.widget_type = widget_type
+        self._highlight_timer: Timer | None = None
 
     def compose(self) -> ComposeResult:
         yield WidgetsList(self.widget_type)
@@ -417,22 +560,31 @@ class WidgetDetailsPane(TabPane):
     def watch_widget_details(self, widget_details: WidgetDetails) -> None:
         assert widget_details is not None
 
-        documentation_link = self.query_one(DocumentationLink)
-        documentation_link.text = widget_details.docs_url
-        documentation_link.url = widget_details.docs_url
+        # Update all the child widgets in a single batch, so they only repaint
+        # once for each highlighted widget.
+        with self.app.batch_update():
+            documentation_link = self.query_one(DocumentationLink)
+            if documentation_link.url != widget_details.docs_url:
+                documentation_link.text = widget_details.docs_url
+                documentation_link.url = widget_details.docs_url
 
-        source_code_link = self.query_one(SourceCodeLink)
-        source_code_link.text = widget_details.source_url
-        source_code_link.url = widget_details.source_url
+            # All the containers share the same source code URL.
+            source_code_link = self.query_one(SourceCodeLink)
+            if source_code_link.url != widget_details.source_url:
+                source_code_link.text = widget_details.source_url
+                source_code_link.url = widget_details.source_url
 
-        inheritance_tree = self.query_one(InheritanceTree)
-        inheritance_tree.base_classes = widget_details.base_classes
+            inheritance_tree = self.query_one(InheritanceTree)
+            inheritance_tree.base_classes = widget_details.base_classes
 
-        child_widgets_list = self.query_one(ChildWidgetsList)
-        child_widgets_list.child_widgets = widget_details.child_widgets
+            child_widgets_list = self.query_one(ChildWidgetsList)
+            child_widgets_list.child_widgets = widget_details.child_widgets
 
-        default_css_view = self.query_one(DefaultCSSView)
-        default_css_view.load_text(widget_details.default_css)
+            # Some widgets share the same default CSS, in which case avoid
+            # needlessly rebuilding the text area document.
+            default_css_view = self.query_one(DefaultCSSView)
+            if default_css_view.text != widget_details.default_css:
+                default_css_view.load_text(widget_details.default_css)
 
     @on(WidgetsList.OptionHighlighted, "WidgetsList")
     def on_widgets_list_option_highlighted(
@@ -443,12 +595,50 @@ class WidgetDetailsPane(TabPane):
         widget_class = event.option_id
         assert widget_class is not None
 
+        # Debounce updating the details, so holding an arrow key through the
+        # widgets list only updates for the widget where the highlight stops.
+        if self._highlight_timer is not None:
+            self._highlight_timer.stop()
+        self._highlight_timer = self.set_timer(
+            0.05,
+            partial(self._update_widget_details, widget_class, widget_type),
+        )
+
+    def _update_widget_details(
+        self,
+        widget_class: str,
+        widget_type: WidgetType,
+    ) -> None:
+        self._highlight_timer = None
         self.widget_details = get_widget_details(widget_class, widget_type)
 
 
 class TextualDissectApp(App):
     AUTO_FOCUS = "WidgetsList"
 
+    def on_mount(self) -> None:
+        self.prewarm_widget_details()
+
+    @work(thread=True, exclusive=True)
+    def prewarm_widget_details(self) -> None:
+        # Load the details for all widgets in the background, so navigating
+        # the widget lists never blocks on importing the widget modules.
+        # The details are saved to disk, so later runs with the same versions
+        # don't need to import the widget modules at all.
+        worker = get_current_worker()
+        read_widget_details_cache()
+        is_cache_outdated = False
+        for widget_type, widget_classes in WIDGET_CLASSES.items():
+            for widget_class in widget_classes:
+                if worker.is_cancelled:
+                    return
+                if widget_class not in _WIDGET_DETAILS_CACHE:
+                    is_cache_outdated = True
+                get_widget_details(widget_class, widget_type)
+
+        if is_cache_outdated:
+            write_widget_details_cache()
+
     def compose(self) -> ComposeResult:
         with TabbedContent():
             yield WidgetDetailsPane(